@@ -1,6 +1,8 @@
 from .logger import (
     LogLevel,
     ClassLogger,
+    BufferedFileHandler,
+    RawFDHandler,
     get_logger,
     get_console_logger,
     get_file_logger,
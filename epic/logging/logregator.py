@@ -1,7 +1,8 @@
 import os
+import copy
 import queue
+import weakref
 import logging
-import traceback
 import threading
 import multiprocessing as mp
 from pathlib import Path
@@ -20,6 +21,123 @@ class QueueLike(Protocol[T]):
     def put(self, obj: T) -> None: ...
 
 
+# Maximum number of records drained from the input queue and dispatched in one go by the consumer thread.
+_CONSUMER_BATCH_SIZE = 256
+
+# Shared formatter used only for rendering exception text; avoids a Formatter allocation per record.
+_EXC_FORMATTER = logging.Formatter()
+
+
+def _drain(input_queue: IterableQueue[T], max_items: int = _CONSUMER_BATCH_SIZE) -> list[T]:
+    """
+    Retrieve a batch of up to `max_items` items from an IterableQueue: one blocking get, then
+    whatever is already queued. Returns an empty list once the queue is closed and exhausted.
+
+    Replaces the queue's iteration protocol on the consumer side, removing the generator resume
+    and method dispatch per item. Lives here rather than on IterableQueue, which belongs to
+    epic-common.
+    """
+    raw_queue = input_queue.queue
+    batch: list[T] = []
+    while True:
+        # Must check the event *before* checking if the queue is empty - see IterableQueue.__iter__
+        no_more_input = input_queue._no_more_input.is_set()
+        try:
+            batch.append(raw_queue.get(timeout=input_queue.interval))
+        except queue.Empty:
+            if no_more_input:
+                return batch
+        else:
+            break
+    try:
+        while len(batch) < max_items:
+            batch.append(raw_queue.get_nowait())
+    except queue.Empty:
+        pass
+    return batch
+
+# The LogregatorHandlers currently installed on the root logger, for O(1) membership checks
+# regardless of how many other handlers are attached to root.
+_INSTALLED_HANDLERS: "weakref.WeakSet[LogregatorHandler]" = weakref.WeakSet()
+
+# Snapshot of all LogregatorHandlers currently installed on the root logger.
+# Rebuilt on every install/uninstall, so that spawning a LogregatorProcess is a single
+# attribute read instead of a scan of the root handlers.
+_ACTIVE_LOGREGATOR_HANDLERS: tuple["LogregatorHandler", ...] = ()
+
+
+def _rebuild_active_handlers() -> None:
+    global _ACTIVE_LOGREGATOR_HANDLERS
+    _ACTIVE_LOGREGATOR_HANDLERS = tuple(_INSTALLED_HANDLERS)
+
+
+# All currently started Logregators, in start order.
+_ACTIVE_LOGREGATORS: list["Logregator"] = []
+
+# Guards against re-entry: creating a multiprocessing queue starts the manager process, which
+# itself forks and re-triggers the at-fork hook below.
+_UPGRADING_QUEUES = False
+
+
+def _upgrade_active_logregators() -> None:
+    """
+    Switch every active Logregator to a process-safe input queue.
+    Called right before a child process is created, so that purely in-process runs
+    never pay for pickling and IPC.
+    """
+    global _UPGRADING_QUEUES
+    if _UPGRADING_QUEUES:
+        return
+    _UPGRADING_QUEUES = True
+    try:
+        for logregator in list(_ACTIVE_LOGREGATORS):
+            logregator._ensure_multiprocessing_queue()
+    finally:
+        _UPGRADING_QUEUES = False
+
+
+# All live LogregatorHandlers, for refreshing their cached pid in forked children.
+_ALL_HANDLERS: "weakref.WeakSet[LogregatorHandler]" = weakref.WeakSet()
+
+
+def _refresh_handler_pids() -> None:
+    pid = os.getpid()
+    for handler in _ALL_HANDLERS:
+        handler._pid = pid
+
+
+# A child created by a plain os.fork (e.g. multiprocessing with the "fork" start method) inherits
+# the installed handlers as-is, so the queues must already be process-safe when the fork happens,
+# and the handlers' cached pid must be refreshed on the other side.
+# Windows has no fork (nor register_at_fork); its children are spawned, which LogregatorProcess covers.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_upgrade_active_logregators, after_in_child=_refresh_handler_pids)
+
+
+class _DeferredExcText:
+    """
+    Lazily formatted exception text for a LogRecord.
+
+    Formatting a traceback walks the stack and reads source lines from disk, so it is deferred
+    until the text is actually needed. Pickling (when the record crosses a process boundary)
+    materializes the text, since traceback objects themselves cannot be pickled.
+    """
+    __slots__ = ('_exc_info', '_text')
+
+    def __init__(self, exc_info):
+        self._exc_info = exc_info
+        self._text = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = _EXC_FORMATTER.formatException(self._exc_info)
+            self._exc_info = None
+        return self._text
+
+    def __reduce__(self):
+        return str, (str(self),)
+
+
 class LogregatorHandler(logging.Handler):
     """
     A Handler that emits log records by putting them in a queue.
@@ -33,51 +151,114 @@ class LogregatorHandler(logging.Handler):
 
     output_queue : queue-like
         Destination of emitted records.
+
+    sink_name : str, optional
+        Name of the sink logger consuming the queue.
+        If provided, records originating from that logger in the process which owns the sink
+        are rejected up front, instead of making a full round-trip through the queue.
+
+    owner_pid : int, optional
+        ID of the process in which the sink logger lives.
+        If not provided, the current process is assumed to be the owner.
     """
     _MARK_OF_THE_LOGREGATOR = "__logregator"
-    
-    def __init__(self, level: LogLevel, output_queue: QueueLike[tuple[int, logging.LogRecord]]):
+
+    def __init__(self, level: LogLevel, output_queue: QueueLike[tuple[int, logging.LogRecord]],
+                 sink_name: str | None = None, owner_pid: int | None = None):
         super().__init__(level)
         self.output_queue = output_queue
+        self._sink_name = sink_name
+        self._owner_pid = os.getpid() if owner_pid is None else owner_pid
+        # os.getpid is a syscall on some platforms - cache it; refreshed at fork (see _refresh_handler_pids)
+        self._pid = os.getpid()
         self._old_root_level = None
+        _ALL_HANDLERS.add(self)
+
+    @property
+    def output_queue(self) -> QueueLike[tuple[int, logging.LogRecord]]:
+        return self._output_queue
+
+    @output_queue.setter
+    def output_queue(self, output_queue: QueueLike[tuple[int, logging.LogRecord]]) -> None:
+        self._output_queue = output_queue
+        # The put method is pre-bound, saving two attribute lookups per emitted record
+        self._put = output_queue.put
+        self._in_process_queue = isinstance(getattr(output_queue, 'queue', None), queue.Queue)
 
     def emit(self, record: logging.LogRecord) -> None:
+        # This runs for every record emitted anywhere in the process, so the checks are ordered
+        # cheapest-reject-first: records below our level are the common case in most deployments,
+        # and cost just an attribute compare here.
+        if record.levelno < self.level:
+            return
         # Ignore these messages - they originate from a Logregator. Prevent cyclic logging!
-        if self.is_handled(record):
+        if record.__dict__.get(self._MARK_OF_THE_LOGREGATOR, False):
             return
-        if record.levelno >= self.level:
-            # Note that we're already freely thread-safe and process-safe because of the Queue
-            if record.exc_info is not None:
-                record.exc_text = '\n'.join(traceback.format_exception(*record.exc_info))
-                record.exc_info = None
-            try:
-                self.output_queue.put((os.getpid(), record))
-            except queue.Full:
-                # If the input queue was closed, suppress error
-                pass
+        if record.name == self._sink_name and self._pid == self._owner_pid:
+            # The sink logger itself was the source of the record, and it lives right here -
+            # no point in sending the record on a round-trip back to it.
+            return
+        # Note that we're already freely thread-safe and process-safe because of the Queue.
+        # Always queue a copy: it keeps the original record intact for any other root handlers,
+        # both when mutating it below and when handing it over through an in-process queue.
+        record = copy.copy(record)
+        if record.exc_info is not None:
+            # The unpicklable exc_info is replaced by lazily-formatted text
+            record.exc_text = _DeferredExcText(record.exc_info)
+            record.exc_info = None
+        if record.args and not self._in_process_queue:
+            # The queue pickles its items; flatten the message so heavy (or unpicklable)
+            # args never cross the process boundary, as the stdlib QueueHandler does.
+            record.msg = record.getMessage()
+            record.args = None
+        try:
+            self._put((self._pid, record))
+        except queue.Full:
+            # If the input queue was closed, suppress error
+            pass
 
     def install(self) -> None:
         # Make sure we're installed only once
-        if self in logging.root.handlers:
+        if self in _INSTALLED_HANDLERS:
             return
+        _INSTALLED_HANDLERS.add(self)
         self._old_root_level = logging.root.level
         logging.root.setLevel(logging.NOTSET + 1)
         logging.root.addHandler(self)
+        _rebuild_active_handlers()
 
     def uninstall(self) -> None:
-        if self in logging.root.handlers:
+        if self in _INSTALLED_HANDLERS:
             if self._old_root_level is None:
                 raise RuntimeError("Cannot uninstall, LogregatorHandler was not properly installed.")
+            _INSTALLED_HANDLERS.discard(self)
             logging.root.removeHandler(self)
             logging.root.setLevel(self._old_root_level)
+            _rebuild_active_handlers()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The handler lock cannot be pickled; the pre-bound put method is re-derived on arrival
+        del state['lock']
+        del state['_put']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.createLock()
+        # Re-derive the per-process values on the receiving side
+        self._put = self._output_queue.put
+        self._pid = os.getpid()
+        _ALL_HANDLERS.add(self)
 
     @classmethod
     def mark_as_handled(cls, record: logging.LogRecord) -> None:
-        setattr(record, cls._MARK_OF_THE_LOGREGATOR, True)
+        # Direct __dict__ access skips the descriptor machinery; LogRecord is a plain class
+        record.__dict__[cls._MARK_OF_THE_LOGREGATOR] = True
 
     @classmethod
     def is_handled(cls, record: logging.LogRecord) -> bool:
-        return getattr(record, cls._MARK_OF_THE_LOGREGATOR, False)
+        return record.__dict__.get(cls._MARK_OF_THE_LOGREGATOR, False)
 
 
 class LogregatorProcess(mp.context.SpawnProcess):
@@ -87,13 +268,13 @@ class LogregatorProcess(mp.context.SpawnProcess):
     """
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # The handler queues must be able to cross the process boundary before they are snapshotted
+        _upgrade_active_logregators()
         # This is automagically transferred along with this entire instance via a socket when the process is started
-        self._logregator_handlers = [
-            (h.level, h.output_queue) for h in logging.root.handlers if isinstance(h, LogregatorHandler)
-        ]
+        self._logregator_handlers = _ACTIVE_LOGREGATOR_HANDLERS
 
     def run(self):
-        handlers = [LogregatorHandler(level, output_queue) for level, output_queue in self._logregator_handlers]
+        handlers = self._logregator_handlers
         for h in handlers:
             h.install()
         try:
@@ -122,6 +303,7 @@ class Logregator:
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self.my_pid = os.getpid()
+        self._addendum_cache: dict[int, str] = {}
         self._old_process: dict[mp.context.BaseContext | ModuleType, type[mp.process.BaseProcess] | None] = {
             mp.get_context("spawn"): None,
         }
@@ -129,6 +311,7 @@ class Logregator:
             for ctx in (mp, mp.context):
                 self._old_process[ctx] = None
         self._input_queue: IterableQueue[tuple[int, logging.LogRecord]] | None = None
+        self._queue_is_process_safe = False
         self._handler: LogregatorHandler | None = None
         self._consumer_thread: threading.Thread | None = None
 
@@ -136,32 +319,114 @@ class Logregator:
     def started(self) -> bool:
         return self._consumer_thread is not None
 
-    def _consume_logs_proc(self) -> None:
-        assert self._input_queue is not None
-        for pid, record in self._input_queue:
-            # record is of type LogRecord - see logging/__init__.py
-            # The handler should've filtered out records below our level, but make sure anyway.
-            # Note that calling isEnabledFor is very cheap since it's cached inside the logger, apparently.
-            if not self.logger.isEnabledFor(record.levelno):
-                continue
-            # Add some stuff to the message
-            addendum = self.logger.name
-            if self.my_pid != pid:
-                addendum = f"{addendum} PID {pid}"
-            elif record.name == self.logger.name:
-                # For local logging, if the sink logger itself was the source of the record, there's no point in
-                # propagating it again...
-                continue
-            record.msg = f"[{addendum}] - {record.msg}"
-            # Send the record for processing in the sink logger - mark it as already handled locally, so that any
-            # local LogeratorHandler ignores it instead of passing it on in an infinite loop.
-            LogregatorHandler.mark_as_handled(record)
-            self.logger.handle(record)
+    def _consume_logs_proc(self, input_queue: IterableQueue[tuple[int, logging.LogRecord]]) -> None:
+        while batch := _drain(input_queue):
+            self._dispatch_batch(batch)
+
+    def _prepare_record(self, pid: int, record: logging.LogRecord) -> bool:
+        # record is of type LogRecord - see logging/__init__.py
+        # The handler should've filtered out records below our level, but make sure anyway.
+        # Note that calling isEnabledFor is very cheap since it's cached inside the logger, apparently.
+        if not self.logger.isEnabledFor(record.levelno):
+            return False
+        # Respect any filters attached to the sink logger, as Logger.handle would
+        if self.logger.filters and not self.logger.filter(record):
+            return False
+        # Add some stuff to the message; the addendum only depends on the pid, so it is cached.
+        # (records emitted by the sink logger itself are already rejected at the producing handler)
+        addendum = self._addendum_cache.get(pid)
+        if addendum is None:
+            addendum = self.logger.name if pid == self.my_pid else f"{self.logger.name} PID {pid}"
+            self._addendum_cache[pid] = addendum
+        record.msg = f"[{addendum}] - {record.msg}"
+        # Exception text not yet materialized (record never crossed a process boundary) - do it now,
+        # so the sink's formatters see a plain string.
+        if record.exc_text is not None and not isinstance(record.exc_text, str):
+            record.exc_text = str(record.exc_text)
+        # Mark the record as already handled locally, so that any local LogregatorHandler ignores it
+        # instead of passing it on in an infinite loop.
+        record.__dict__[LogregatorHandler._MARK_OF_THE_LOGREGATOR] = True
+        return True
+
+    def _collect_sink_handlers(self) -> list[logging.Handler]:
+        # The same handlers Logger.handle would reach, walking up the hierarchy while propagation is on
+        handlers: list[logging.Handler] = []
+        logger = self.logger
+        while logger:
+            handlers.extend(logger.handlers)
+            if not logger.propagate:
+                break
+            logger = logger.parent
+        if not handlers and logging.lastResort is not None:
+            handlers.append(logging.lastResort)
+        return handlers
+
+    def _dispatch_batch(self, batch: list[tuple[int, logging.LogRecord]]) -> None:
+        handlers = self._collect_sink_handlers()
+        if not handlers:
+            return
+        # Records below every handler's threshold are dropped before their message is ever touched
+        min_level = min(handler.level for handler in handlers)
+        records = [
+            record for pid, record in batch
+            if record.levelno >= min_level and self._prepare_record(pid, record)
+        ]
+        if not records:
+            return
+        # Emit directly to the sink's handlers, acquiring each handler's lock once per batch
+        # instead of once per record as going through Logger.handle would.
+        for handler in handlers:
+            level = handler.level
+            handler.acquire()
+            try:
+                for record in records:
+                    if record.levelno >= level and handler.filter(record):
+                        handler.emit(record)
+            finally:
+                handler.release()
+
+    def _start_consumer(self, input_queue: IterableQueue[tuple[int, logging.LogRecord]]) -> threading.Thread:
+        thread = threading.Thread(target=self._consume_logs_proc, args=(input_queue,))
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def _ensure_multiprocessing_queue(self) -> None:
+        """
+        Replace the thread-backed input queue with a process-safe one.
+        Must be called before any child process which may emit log records is created.
+        """
+        if not self.started or self._queue_is_process_safe:
+            return
+        old_queue = self._input_queue
+        old_consumer = self._consumer_thread
+        new_queue: IterableQueue[tuple[int, logging.LogRecord]] = IterableQueue("multiprocessing")
+        self._input_queue = new_queue
+        self._queue_is_process_safe = True
+        self._handler.output_queue = new_queue
+        _rebuild_active_handlers()
+        # Let the old consumer drain any records emitted before the switch, preserving their order,
+        # then resume consumption from the new queue.
+        old_queue.no_more_input()
+        old_consumer.join()
+        # A producer that grabbed the old queue's put before the swap may still have managed to
+        # enqueue after the consumer finished; sweep any such leftovers into the new queue.
+        try:
+            while True:
+                new_queue.put(old_queue.queue.get_nowait())
+        except queue.Empty:
+            pass
+        self._consumer_thread = self._start_consumer(new_queue)
 
     def start(self) -> None:
         if not self.started:
-            self._input_queue = IterableQueue("multiprocessing")
-            self._handler = LogregatorHandler(self.logger.getEffectiveLevel(), self._input_queue)
+            # Start with a cheap in-process queue; it is upgraded to a process-safe one the moment
+            # a child process is about to be created (see _ensure_multiprocessing_queue).
+            self._input_queue = IterableQueue("threading", interval=0.05)
+            self._queue_is_process_safe = False
+            self._handler = LogregatorHandler(
+                self.logger.getEffectiveLevel(), self._input_queue, sink_name=self.logger.name,
+            )
             self._handler.install()
             # Ugly but effective
             for ctx in self._old_process:
@@ -169,14 +434,16 @@ class Logregator:
                 ctx.Process = LogregatorProcess
             # Start the consumer thread in advance - it immediately blocks on the queue, so it doesn't cost anything
             try:
-                self._consumer_thread = threading.Thread(target=self._consume_logs_proc)
-                self._consumer_thread.daemon = True
-                self._consumer_thread.start()
+                self._consumer_thread = self._start_consumer(self._input_queue)
             except Exception:
                 self._consumer_thread = None
+            else:
+                _ACTIVE_LOGREGATORS.append(self)
 
     def stop(self) -> None:
         if self.started:
+            if self in _ACTIVE_LOGREGATORS:
+                _ACTIVE_LOGREGATORS.remove(self)
             try:
                 self._input_queue.no_more_input()
             except Exception:
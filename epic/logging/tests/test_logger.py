@@ -1,3 +1,4 @@
+import time
 import pytest
 import logging
 import logging.handlers
@@ -11,6 +12,8 @@ from epic.logging import (
     get_file_and_console_logger,
     class_logger,
     ClassLogger,
+    BufferedFileHandler,
+    RawFDHandler,
     Logregator,
     Logtor,
 )
@@ -45,6 +48,14 @@ class TestGetLogger:
             assert get_logger(level=level_name).level == level_num
             assert get_logger(level=level_num).level == level_num
 
+    def test_level_reapplied(self):
+        # The same logger is returned for repeated calls, with the requested level each time
+        name = 'test_level_reapplied'
+        assert get_logger(name, 'DEBUG').level == logging.DEBUG
+        assert get_logger(name, 'ERROR').level == logging.ERROR
+        assert get_logger(name, 'DEBUG').level == logging.DEBUG
+        assert get_logger(name, 'DEBUG') is get_logger(name, logging.DEBUG)
+
     def test_no_handlers(self):
         assert get_logger().hasHandlers()
 
@@ -113,6 +124,94 @@ class TestPreconfiguredLoggers:
         logger.info("⚠️")
 
 
+class TestBufferedFileHandler:
+    @staticmethod
+    def _count_lines(path) -> int:
+        with open(path) as f:
+            return sum(1 for _ in f)
+
+    def test_used_by_file_loggers(self, tmp_path):
+        for logger in (
+            get_file_logger('test_buffered_file', tmp_path / 'f.txt'),
+            get_file_and_console_logger('test_buffered_file_and_console', tmp_path / 'fc.txt'),
+        ):
+            assert any(isinstance(h, BufferedFileHandler) for h in logger.handlers)
+
+    def test_no_flush_per_record(self, tmp_path):
+        path = tmp_path / 'temp.txt'
+        handler = BufferedFileHandler(path, flush_interval=60)
+        logger = get_logger('test_buffered_no_flush', logging.INFO, handler)
+        logger.info("a message")
+        assert self._count_lines(path) == 0
+        handler.flush()
+        assert self._count_lines(path) == 1
+
+    def test_flush_on_capacity(self, tmp_path):
+        path = tmp_path / 'temp.txt'
+        n = 10
+        logger = get_logger('test_buffered_capacity', logging.INFO,
+                            BufferedFileHandler(path, capacity=n, flush_interval=60))
+        for i in range(n):
+            logger.info("message %d", i)
+        assert self._count_lines(path) == n
+
+    def test_flush_on_severity(self, tmp_path):
+        path = tmp_path / 'temp.txt'
+        logger = get_logger('test_buffered_severity', logging.INFO, BufferedFileHandler(path, flush_interval=60))
+        logger.info("info message")
+        assert self._count_lines(path) == 0
+        logger.error("error message")
+        assert self._count_lines(path) == 2
+
+    def test_flush_on_interval(self, tmp_path):
+        path = tmp_path / 'temp.txt'
+        logger = get_logger('test_buffered_interval', logging.INFO, BufferedFileHandler(path, flush_interval=0.05))
+        logger.info("a message")
+        for _ in range(100):
+            if self._count_lines(path) == 1:
+                break
+            time.sleep(0.05)
+        else:
+            pytest.fail("periodic flush did not happen")
+
+    def test_flush_on_close(self, tmp_path):
+        path = tmp_path / 'temp.txt'
+        handler = BufferedFileHandler(path, flush_interval=60)
+        get_logger('test_buffered_close', logging.INFO, handler).info("a message")
+        handler.close()
+        assert self._count_lines(path) == 1
+
+    def test_invalid_flush_level(self, tmp_path):
+        with pytest.raises(ValueError):
+            BufferedFileHandler(tmp_path / 'temp.txt', flush_level='NOPE')
+
+
+class TestRawFDHandler:
+    def test_write_per_record(self, tmp_path):
+        path = tmp_path / 'temp.txt'
+        logger = get_logger('test_raw_fd', logging.INFO, RawFDHandler(path))
+        logger.info("first ⚠️")
+        logger.info("second")
+        with open(path, encoding='utf-8') as f:
+            assert f.read() == "first ⚠️\nsecond\n"
+
+    def test_modes(self, tmp_path):
+        path = tmp_path / 'temp.txt'
+        path.write_text("existing\n")
+        handler = RawFDHandler(path)
+        get_logger('test_raw_fd_append', logging.INFO, handler).info("appended")
+        handler.close()
+        assert path.read_text() == "existing\nappended\n"
+        handler = RawFDHandler(path, mode='w')
+        get_logger('test_raw_fd_truncate', logging.INFO, handler).info("truncated")
+        handler.close()
+        assert path.read_text() == "truncated\n"
+
+    def test_invalid_mode(self, tmp_path):
+        with pytest.raises(ValueError):
+            RawFDHandler(tmp_path / 'temp.txt', mode='x')
+
+
 def business_code(logname: str, message, level=logging.INFO) -> None:
     """Some code that uses logging to be run by child processes and such in order to test Logregator."""
     logger = logging.getLogger(logname)
@@ -217,6 +316,65 @@ class TestLogregator:
             f"{name} [{outer_sink_name} PID {p.pid}] - {msg}" for p, (name, msg) in zip(processes, names_msgs)
         }
 
+    def test_multiprocessing_spawn(self):
+        # Spawned children receive the pickled handlers through LogregatorProcess,
+        # regardless of the platform's default start method
+        sink_name = 'test_multiprocessing_spawn'
+        name, msg = "internal_spawn", "spawn test"
+        messages = []
+        ctx = mp.get_context("spawn")
+        with self.sink_logger(sink_name, messages) as sink, Logregator(sink):
+            p = ctx.Process(target=business_code, args=(name, msg))
+            p.start()
+            p.join()
+        assert messages == [f"{name} [{sink_name} PID {p.pid}] - {msg}"]
+
+    def test_queue_upgrade(self):
+        # Records logged before the first child process exists (while the input queue is still
+        # thread-backed) must survive the upgrade to a process-safe queue, in order.
+        sink_name = 'test_queue_upgrade'
+        messages = []
+        with self.sink_logger(sink_name, messages) as sink, Logregator(sink):
+            business_code("internal_before", "before child")
+            p = mp.Process(target=business_code, args=("internal_after", "after child"))
+            p.start()
+            p.join()
+        assert messages == [
+            f"internal_before [{sink_name}] - before child",
+            f"internal_after [{sink_name} PID {p.pid}] - after child",
+        ]
+
+    def test_exception(self):
+        sink_name = 'test_exception'
+        name = "internal"
+        messages = []
+        with self.sink_logger(sink_name, messages) as sink, Logregator(sink):
+            logger = logging.getLogger(name)
+            logger.setLevel(logging.INFO)
+            try:
+                raise ValueError("intentional test error")
+            except ValueError:
+                logger.exception("an exception occurred")
+        assert len(messages) == 1
+        assert messages[0].startswith(f"{name} [{sink_name}] - an exception occurred")
+        assert "Traceback" in messages[0]
+        assert "ValueError: intentional test error" in messages[0]
+
+    def test_sink_filters(self):
+        sink_name = 'test_sink_filters'
+        name = "internal"
+        messages = []
+        logger_filter = lambda record: "drop-logger" not in record.msg
+        handler_filter = lambda record: "drop-handler" not in record.msg
+        with self.sink_logger(sink_name, messages) as sink, Logregator(sink):
+            sink.addFilter(logger_filter)
+            sink.handlers[0].addFilter(handler_filter)
+            for msg in ("drop-logger", "drop-handler", "keep me"):
+                business_code(name, msg)
+        # Only remove the filter once the Logregator has stopped and its consumer has drained
+        sink.removeFilter(logger_filter)
+        assert messages == [f"{name} [{sink_name}] - keep me"]
+
     def test_sink_log_level(self):
         sink_name = 'test_sink_log_level'
         name = "internal"